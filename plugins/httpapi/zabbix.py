@@ -153,7 +153,8 @@ class HttpApi(HttpApiBase):
             # we provided fake one in login() method to correctly handle HTTP basic auth header
             data.pop('auth', None)
 
-        data = json.dumps(data)
+        # Serialized once here; connection.send() retries reuse the same body
+        data = json.dumps(data, separators=(',', ':'))
         try:
             self._display_request(request_method, path)
             response, response_data = self.connection.send(
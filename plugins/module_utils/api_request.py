@@ -19,6 +19,10 @@ from ansible.module_utils._text import to_text
 
 
 class ZabbixApiRequest(object):
+    # Zabbix API version per persistent connection socket. The httpapi plugin
+    # keeps it for the whole play; this spares the RPC to the connection for
+    # every further ZabbixBase object created within the same module run.
+    _api_versions = {}
 
     def __init__(self, module):
         self.module = module
@@ -50,7 +54,10 @@ class ZabbixApiRequest(object):
         return response
 
     def api_version(self):
-        return self.connection.api_version()
+        socket_path = self.module._socket_path
+        if socket_path not in ZabbixApiRequest._api_versions:
+            ZabbixApiRequest._api_versions[socket_path] = self.connection.api_version()
+        return ZabbixApiRequest._api_versions[socket_path]
 
     @staticmethod
     def payload_builder(method_, params, jsonrpc_version='2.0', reqid=str(uuid4()), **kwargs):
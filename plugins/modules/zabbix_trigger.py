@@ -22,7 +22,8 @@ options:
     name:
         description:
             - Name of Zabbix trigger
-        required: true
+            - Required unless I(triggers) is used.
+        required: false
         type: str
     host:
         description:
@@ -32,7 +33,8 @@ options:
     expression:
         description:
             - Reduced trigger expression. (required for create operations)
-        required: true
+            - Required with I(name) when I(state=present).
+        required: false
         type: str
     priority:
         description:
@@ -59,7 +61,7 @@ options:
         description:
             - "	Allow manual close."
         required: false
-        choices: [no, yes]
+        choices: ["no", "yes"]
         default: "no"
         type: str
     state:
@@ -86,6 +88,72 @@ options:
                     - Service tag value.
                 required: false
                 type: str
+    triggers:
+        description:
+            - List of triggers on I(host) to create/update/delete in a single invocation.
+            - All triggers are looked up with one API call and created/updated with at most one call each.
+            - Mutually exclusive with I(name), I(tags), I(priority), I(status), I(type) and I(manual_close);
+              set those per trigger instead.
+        required: false
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                    - Name of Zabbix trigger
+                required: true
+                type: str
+            expression:
+                description:
+                    - Reduced trigger expression.
+                    - Required when I(state=present).
+                required: false
+                type: str
+            priority:
+                description:
+                    - "Severity of the trigger."
+                required: false
+                choices: [not_classified, information, warning, average, high, disaster]
+                default: "not_classified"
+                type: str
+            status:
+                description:
+                    - "Whether the trigger is enabled or disabled."
+                required: false
+                choices: [enabled, disabled]
+                default: "enabled"
+                type: str
+            type:
+                description:
+                    - "Whether the trigger can generate multiple problem events."
+                required: false
+                choices: [single, multiple]
+                default: "single"
+                type: str
+            manual_close:
+                description:
+                    - "Allow manual close."
+                required: false
+                choices: ["no", "yes"]
+                default: "no"
+                type: str
+            tags:
+                description:
+                    - Tags to be created for the trigger.
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    tag:
+                        description:
+                            - Service tag name.
+                        required: true
+                        type: str
+                    value:
+                        description:
+                            - Service tag value.
+                        required: false
+                        type: str
 
 extends_documentation_fragment:
 - community.zabbix.zabbix
@@ -130,6 +198,30 @@ EXAMPLES = """
         value: availability
       - tag: service
         value: omiliaprdn1-nginx
+
+- name: Create several Zabbix triggers on one host in a single task
+  # set task level variables as we change ansible_connection plugin here
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_trigger:
+    host: omiliaprdn1
+    state: present
+    triggers:
+      - name: nginx.service not running SLA
+        expression: "last(/omiliaprdn1.central.root.alpha.gr/systemd.service.active_state[\"nginx.service\"])<>1"
+        priority: warning
+      - name: sshd.service not running SLA
+        expression: "last(/omiliaprdn1.central.root.alpha.gr/systemd.service.active_state[\"sshd.service\"])<>1"
+        priority: high
+        tags:
+          - tag: scope
+            value: availability
 """
 
 RETURN = """
@@ -143,113 +235,93 @@ from ansible_collections.community.zabbix.plugins.module_utils.base import Zabbi
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
 
 
+_PRIORITY_MAP = {"not_classified": "0", "information": "1", "warning": "2",
+                 "average": "3", "high": "4", "disaster": "5"}
+_STATUS_MAP = {"enabled": "0", "disabled": "1"}
+_TYPE_MAP = {"single": "0", "multiple": "1"}
+_MANUAL_CLOSE_MAP = {"no": "0", "yes": "1"}
+
+# (field, value map) for every choice field of generate_trigger_config()
+_FIELD_SPECS = [("priority", _PRIORITY_MAP), ("status", _STATUS_MAP),
+                ("type", _TYPE_MAP), ("manual_close", _MANUAL_CLOSE_MAP)]
+
+# Trigger fields produced by generate_trigger_config(), the only ones compared on update
+_TRIGGER_FIELDS = ["description", "expression", "recovery_mode", "priority", "status", "type", "manual_close"]
+
+
+def _canon(config):
+    """Canonical, order-independent form of a trigger config so two configs compare with one =="""
+    return tuple(sorted(
+        (k, tuple(sorted((t["tag"], t.get("value") or "") for t in v or [])) if k == "tags" else str(v))
+        for k, v in config.items()))
+
+
 class Trigger(ZabbixBase):
-    # DONE
-    def get_trigger_ids(self, host, trigger_name):
-        trigger_ids = []
-        triggers = self._zapi.trigger.get({"filter": {"host": host}})
-        for trigger in triggers:
-            if trigger['description'] == trigger_name:
-                trigger_ids.append(trigger["triggerid"])
-        return trigger_ids
-    # DONE
+    def get_trigger_ids(self, host, trigger_names):
+        # Maps the id of every matching trigger to its description
+        triggers = self._zapi.trigger.get({"output": ["triggerid", "description"],
+                                           "filter": {"host": host, "description": trigger_names}})
+        return dict((trigger["triggerid"], trigger["description"]) for trigger in triggers)
+
+    def fetch_trigger(self, host, trigger_names):
+        triggers = self._zapi.trigger.get({"output": ["triggerid"] + _TRIGGER_FIELDS, "expandExpression": True,
+                                           "selectTags": ["tag", "value"],
+                                           "filter": {"host": host, "description": trigger_names}})
+        return triggers
+
     def delete_trigger(self, trigger_ids):
         if self._module.check_mode:
             self._module.exit_json(changed=True)
         self._zapi.trigger.delete(trigger_ids)
-    # DONE
-    def dump_triggers(self, trigger_ids):
-        triggers = self._zapi.trigger.get({"output": "extend", "filter": {"triggerids": trigger_ids}, "selectHosts": "extend",
-                                           "selectHostGroups": "extend", "selectTriggerDiscovery": "extend",
-                                           "selectItems": "extend", "selectFunctions": "extend", "selectDependencies": "extend",
-                                           "selectDiscoveryRule": "extend", "selectTags": "extend"})
 
-        return triggers
-    # DONE
-    def generate_trigger_config(self, description, expression, priority, status, recovery_mode, manual_close, tags):
+    def generate_trigger_config(self, description, expression, priority, status, trigger_type, recovery_mode, manual_close, tags):
 
         request = {
             "description": description,
             "expression": expression,
-            "recovery_mode": "0" # unsupported
+            "recovery_mode": "0"  # unsupported
         }
 
         if tags:
-            request["tags"] = tags
+            request["tags"] = [{"tag": t["tag"], "value": t.get("value") or ""} for t in tags]
         else:
             request["tags"] = []
 
-        request["priority"] = "0"
-        if priority:
-            priority_map = {"not_classified": "0", "information": "1", "warning": "2",
-                      "average": "3", "high": "4", "disaster": "5"}
-            if priority not in priority_map:
-                self._module.fail_json(msg="Wrong value for 'priority' parameter.")
-            else:
-                request["priority"] = pv_map[priority]
-
-        request["status"] = "0"
-        if status:
-            status_map = {"enabled": "0", "disabled": "1"}
-            if status not in status_map:
-                self._module.fail_json(msg="Wrong value for 'status' parameter.")
-            else:
-                request["status"] = status_map[status]
-
-        request["type"] = "0"
-        if type:
-            type_map = {"single": "0", "multiple": "1"}
-            if type not in type_map:
-                self._module.fail_json(msg="Wrong value for 'type' parameter.")
-            else:
-                request["type"] = status_map[type]
-
-        request["manual_close"] = "0"
-        if manual_close:
-            manual_close_map = {"no": "0", "yes": "1"}
-            if manual_close not in manual_close_map:
-                self._module.fail_json(msg="Wrong value for 'manual_close' parameter.")
-            else:
-                request["manual_close"] = status_map[manual_close]
-
+        values = {"priority": priority, "status": status, "type": trigger_type, "manual_close": manual_close}
+        for field, mapping in _FIELD_SPECS:
+            # Allowed values and defaults come from the argument spec
+            request[field] = mapping[values[field]]
 
         return request
-    # DONE
-    def create_trigger(self, description, expression, priority, status, recovery_mode, manual_close, tags):
-        if self._module.check_mode:
-            self._module.exit_json(changed=True)
-
-        self._zapi.trigger.create(self.generate_trigger_config(description, expression, priority, status, recovery_mode, manual_close, tags))
-    # DONE
-    def update_trigger(self, trigger_id, description, expression, priority, status, recovery_mode, manual_close, tags):
-        generated_config = self.generate_trigger_config(description, expression, priority, status, recovery_mode, manual_close, tags)
-        live_config = self.dump_triggers(trigger_id)[0]
 
-        change_parameters = {}
-        difference = zabbix_utils.helper_cleanup_data(zabbix_utils.helper_compare_dictionaries(generated_config, live_config, change_parameters))
-
-        if difference == {}:
-            self._module.exit_json(changed=False, msg="Trigger %s up to date" % name)
+    def needs_update(self, generated_config, live_config):
+        return _canon(generated_config) != _canon(dict((k, live_config.get(k)) for k in generated_config))
 
+    def apply(self, configs):
+        # Configs carrying a triggerid are updated, the rest created, with one API call each
+        to_create = [config for config in configs if "triggerid" not in config]
+        to_update = [config for config in configs if "triggerid" in config]
         if self._module.check_mode:
             self._module.exit_json(changed=True)
-        generated_config["triggerid"] = trigger_id
-        self._zapi.trigger.update(generated_config)
-        self._module.exit_json(changed=True, msg="Trigger %s updated" % name)
+        if to_create:
+            self._zapi.trigger.create(to_create)
+        if to_update:
+            self._zapi.trigger.update(to_update)
+        return to_create, to_update
 
 
 def main():
     argument_spec = zabbix_utils.zabbix_common_argument_spec()
     argument_spec.update(dict(
         host=dict(type="str", required=True),
-        name=dict(type="str", required=True),
-        expression=dict(type="str", required=True),
+        name=dict(type="str", required=False),
+        expression=dict(type="str", required=False),
         state=dict(default="present", choices=["present", "absent"]),
-        priority=dict(type="str", required=False),
+        priority=dict(type="str", required=False, default="not_classified", choices=list(_PRIORITY_MAP)),
         recovery_mode=dict(type="str", required=False),
-        status=dict(type="str", required=False),
-        type=dict(type="str", required=False),
-        manual_close=dict(type="str", required=False),
+        status=dict(type="str", required=False, default="enabled", choices=list(_STATUS_MAP)),
+        type=dict(type="str", required=False, default="single", choices=list(_TYPE_MAP)),
+        manual_close=dict(type="str", required=False, default="no", choices=list(_MANUAL_CLOSE_MAP)),
         tags=dict(
             type="list",
             required=False,
@@ -265,43 +337,103 @@ def main():
                 )
             )
         ),
+        triggers=dict(
+            type="list",
+            required=False,
+            elements="dict",
+            options=dict(
+                name=dict(type="str", required=True),
+                expression=dict(type="str", required=False),
+                priority=dict(type="str", required=False, default="not_classified", choices=list(_PRIORITY_MAP)),
+                status=dict(type="str", required=False, default="enabled", choices=list(_STATUS_MAP)),
+                type=dict(type="str", required=False, default="single", choices=list(_TYPE_MAP)),
+                manual_close=dict(type="str", required=False, default="no", choices=list(_MANUAL_CLOSE_MAP)),
+                tags=dict(
+                    type="list",
+                    required=False,
+                    elements="dict",
+                    options=dict(
+                        tag=dict(
+                            type="str",
+                            required=True
+                        ),
+                        value=dict(
+                            type="str",
+                            required=False
+                        )
+                    )
+                ),
+            )
+        ),
     ))
     module = AnsibleModule(
         argument_spec=argument_spec,
+        required_one_of=[["name", "triggers"]],
+        mutually_exclusive=[["name", "triggers"], ["tags", "triggers"], ["priority", "triggers"], ["status", "triggers"],
+                            ["type", "triggers"], ["manual_close", "triggers"]],
         supports_check_mode=True
     )
 
-    host = module.params["host"]
-    description = module.params["name"]
-    expression = module.params["expression"]
-    state = module.params["state"]
-    priority = module.params["priority"]
-    status = module.params["status"]
-    type = module.params["type"]
-    manual_close = module.params["manual_close"]
-    recovery_mode = module.params["recovery_mode"]
-    tags = module.params["tags"]
-
+    p = module.params
+    host, description, expression, state, priority, status, trigger_type, manual_close, recovery_mode, tags, triggers = (
+        p[k] for k in ("host", "name", "expression", "state", "priority", "status", "type", "manual_close",
+                       "recovery_mode", "tags", "triggers"))
+
+    # A single trigger is handled as a batch of one
+    if triggers is None:
+        triggers = [dict(name=description, expression=expression, priority=priority, status=status, type=trigger_type,
+                         manual_close=manual_close, recovery_mode=recovery_mode, tags=tags)]
+    elif not triggers:
+        module.fail_json(msg="'triggers' must contain at least one trigger.")
+    names = [t["name"] for t in triggers]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if duplicates:
+        module.fail_json(msg="Duplicate trigger name(s) in 'triggers': %s" % ", ".join(duplicates))
+    if state == "present":
+        missing_expression = [t["name"] for t in triggers if not t["expression"]]
+        if missing_expression:
+            module.fail_json(msg="'expression' is required with state=present for trigger(s): %s" % ", ".join(missing_expression))
 
     # Load trigger module
     trigger = Trigger(module)
-    trigger_ids = trigger.get_trigger_ids(host, name)
 
     # Delete trigger
     if state == "absent":
-        if not trigger_ids:
-            module.exit_json(changed=False, msg="Trigger not found, no change: %s" % name)
-        trigger.delete_trigger(trigger_ids)
-        module.exit_json(changed=True, result="Successfully deleted trigger(s) %s" % name)
+        found = trigger.get_trigger_ids(host, names)
+        if not found:
+            module.exit_json(changed=False, msg="Trigger not found, no change: %s" % ", ".join(names))
+        trigger.delete_trigger(list(found))
+        module.exit_json(changed=True, result="Successfully deleted trigger(s) %s" % ", ".join(sorted(set(found.values()))))
 
     elif state == "present":
-        # Does not exists going to create it
-        if not trigger_ids:
-            trigger.create_trigger(description, expression, priority, status, recovery_mode, manual_close, tags)
-            module.exit_json(changed=True, msg="Trigger %s created" % name)
-        # Else we update it if needed
-        else:
-            trigger.update_trigger(trigger_ids[0], description, expression, priority, status, recovery_mode, manual_close, tags)
+        existing = {}
+        for live_config in trigger.fetch_trigger(host, names):
+            existing.setdefault(live_config["description"], []).append(live_config)
+
+        to_apply = []
+        for params in triggers:
+            generated_config = trigger.generate_trigger_config(
+                description=params["name"], expression=params["expression"], priority=params["priority"],
+                status=params["status"], trigger_type=params["type"], recovery_mode=params.get("recovery_mode"),
+                manual_close=params["manual_close"], tags=params["tags"])
+            # Does not exists going to create it
+            if params["name"] not in existing:
+                to_apply.append(generated_config)
+            # Else we update it if needed
+            elif trigger.needs_update(generated_config, existing[params["name"]][0]):
+                generated_config["triggerid"] = existing[params["name"]][0]["triggerid"]
+                to_apply.append(generated_config)
+
+        if not to_apply:
+            module.exit_json(changed=False, msg="Trigger %s up to date" % ", ".join(names))
+
+        created, updated = trigger.apply(to_apply)
+        msg = []
+        if created:
+            msg.append("Trigger %s created" % ", ".join(t["description"] for t in created))
+        if updated:
+            msg.append("Trigger %s updated" % ", ".join(t["description"] for t in updated))
+        module.exit_json(changed=True, msg="; ".join(msg))
 
 
 if __name__ == "__main__":